@@ -6,6 +6,7 @@ from pyiskra.exceptions import DeviceConnectionError
 
 import asyncio
 import logging
+import operator
 
 
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +14,37 @@ logger = logging.getLogger(__name__)
 
 authentication = {"username": "admin", "password": "iskra"}
 
+# Fetch all phase fields in one C-level attrgetter call and render them
+# through a pre-built template instead of walking the attribute chains
+# per field in an f-string
+PHASE_GETTER = operator.attrgetter(
+    "voltage.value",
+    "voltage.units",
+    "current.value",
+    "current.units",
+    "active_power.value",
+    "active_power.units",
+    "reactive_power.value",
+    "reactive_power.units",
+    "apparent_power.value",
+    "apparent_power.units",
+    "power_factor.value",
+    "power_factor.units",
+    "power_angle.value",
+    "power_angle.units",
+    "thd_voltage.value",
+    "thd_voltage.units",
+    "thd_current.value",
+    "thd_current.units",
+)
+# Values are kept as raw floats on the decode path and quantized here
+PHASE_FORMAT = (
+    "Phase {} - U: {:.3f} {}, I: {:.3f} {} P: {:.3f} {} Q: {:.3f} {} S: {:.3f} {} "
+    "PF: {:.3f} {} PA: {:.3f} {} THD U: {:.3f} {} THD I: {:.3f} {}\n"
+)
+NON_RESETTABLE_FORMAT = "Non-resettable counter, Value: {:.3f}{}, Direction: {} \n"
+RESETTABLE_FORMAT = "Resettable counter, Value: {:.3f}{}, Direction: {} \n"
+
 
 async def main():
 
@@ -51,32 +83,63 @@ async def main():
                 f"Failed to create Device object for {device.model} {device.serial}: {e}"
             )
 
-    for device in devices.copy():
+    # Expand gateways in place, iterating by index over the original
+    # length so the list isn't copied and appended children aren't revisited
+    for i in range(len(devices)):
+        device = devices[i]
         if device.is_gateway:
-            devices += device.get_child_devices()
+            devices.extend(device.get_child_devices())
+
+    async def update_device_group(group):
+        # Devices sharing an adapter (e.g. an RTU bus) are updated
+        # sequentially so their requests never interleave
+        for device in group:
+            logger.info(f"Updating status for {device.model} {device.serial}")
+            try:
+                await device.update_status()
+            except Exception as e:
+                logger.error(
+                    f"Failed to update status for {device.model} {device.serial}: {e}"
+                )
+
+    # Deadline-based scheduling keeps the poll period constant instead
+    # of drifting by however long each update cycle takes
+    poll_period = 5.0
+    loop = asyncio.get_running_loop()
+    next_deadline = loop.time()
 
     while True:
+        # Update devices concurrently, grouped per adapter
+        groups = {}
         for device in devices:
-            logger.info(f"Updating status for {device.model} {device.serial}")
-            await device.update_status()
+            groups.setdefault(id(device.adapter), []).append(device)
+        await asyncio.gather(
+            *[update_device_group(group) for group in groups.values()]
+        )
 
+        for device in devices:
             message = ""
 
             if device.supports_measurements:
                 message += f"Timestamp: {device.measurements.timestamp}\n"
                 for index, phase in enumerate(device.measurements.phases):
-                    message += f"Phase {index+1} - U: {phase.voltage.value} {phase.voltage.units}, I: {phase.current.value} {phase.current.units} P: {phase.active_power.value} {phase.active_power.units} Q: {phase.reactive_power.value} {phase.reactive_power.units} S: {phase.apparent_power.value} {phase.apparent_power.units} PF: {phase.power_factor.value} {phase.power_factor.units} PA: {phase.power_angle.value} {phase.power_angle.units} THD U: {phase.thd_voltage.value} {phase.thd_voltage.units} THD I: {phase.thd_current.value} {phase.thd_current.units}\n"
+                    message += PHASE_FORMAT.format(index + 1, *PHASE_GETTER(phase))
 
             if device.supports_counters:
                 for counter in device.counters.non_resettable:
-                    message += f"Non-resettable counter, Value: {counter.value}{counter.units}, Direction: {counter.direction} \n"
+                    message += NON_RESETTABLE_FORMAT.format(
+                        counter.value, counter.units, counter.direction
+                    )
 
                 for counter in device.counters.resettable:
-                    message += f"Resettable counter, Value: {counter.value}{counter.units}, Direction: {counter.direction} \n"
+                    message += RESETTABLE_FORMAT.format(
+                        counter.value, counter.units, counter.direction
+                    )
 
             logger.info(message)
 
-        await asyncio.sleep(5)
+        next_deadline += poll_period
+        await asyncio.sleep(max(0, next_deadline - loop.time()))
 
 
 if __name__ == "__main__":
@@ -1,10 +1,42 @@
 import asyncio
+import operator
 from pyiskra.devices import Device
 from pyiskra.adapters import Modbus
 
 
 Device_ip = "10.34.11.104"
 
+# Fetch all phase fields in one C-level attrgetter call and render them
+# through a pre-built template instead of walking the attribute chains
+# per field in an f-string
+PHASE_GETTER = operator.attrgetter(
+    "voltage.value",
+    "voltage.units",
+    "current.value",
+    "current.units",
+    "active_power.value",
+    "active_power.units",
+    "reactive_power.value",
+    "reactive_power.units",
+    "apparent_power.value",
+    "apparent_power.units",
+    "power_factor.value",
+    "power_factor.units",
+    "power_angle.value",
+    "power_angle.units",
+    "thd_voltage.value",
+    "thd_voltage.units",
+    "thd_current.value",
+    "thd_current.units",
+)
+# Values are kept as raw floats on the decode path and quantized here
+PHASE_FORMAT = (
+    "Phase {} - U: {:.3f}{}, I: {:.3f}{} P: {:.3f}{} Q: {:.3f}{} S: {:.3f}{} "
+    "PF: {:.3f}{} PA: {:.3f}{} THD U: {:.3f}{} THD I: {:.3f}{}"
+)
+NON_RESETTABLE_FORMAT = "Non-resettable counter, Value: {:.3f}{}, Direction: {}"
+RESETTABLE_FORMAT = "Resettable counter Value: {:.3f}{}, Direction: {}"
+
 
 async def main():
     # Set device IP address
@@ -12,7 +44,8 @@ async def main():
     # Create adapter
     adapter = Modbus(protocol="tcp", ip_address=Device_ip)
 
-    await adapter.get_basic_info()
+    # Only model and serial are used here, skip the description/location read
+    await adapter.get_basic_info(minimal=True)
 
     # Create device
     device = await Device.create_device(adapter)
@@ -30,22 +63,30 @@ async def main():
         print(f"Updating status for {device.model} {device.serial}")
         await device.update_status()
 
+        # Collect the report lines and emit them in a single print
+        lines = []
+
         if device.supports_measurements:
             for index, phase in enumerate(device.measurements.phases):
-                print(
-                    f"Phase {index+1} - U: {phase.voltage.value}{phase.voltage.units}, I: {phase.current.value}{phase.current.units} P: {phase.active_power.value}{phase.active_power.units} Q: {phase.reactive_power.value}{phase.reactive_power.units} S: {phase.apparent_power.value}{phase.apparent_power.units} PF: {phase.power_factor.value}{phase.power_factor.units} PA: {phase.power_angle.value}{phase.power_angle.units} THD U: {phase.thd_voltage.value}{phase.thd_voltage.units} THD I: {phase.thd_current.value}{phase.thd_current.units}"
-                )
+                lines.append(PHASE_FORMAT.format(index + 1, *PHASE_GETTER(phase)))
 
         if device.supports_counters:
             for counter in device.counters.non_resettable:
-                print(
-                    f"Non-resettable counter, Value: {counter.value}{counter.units}, Direction: {counter.direction}"
+                lines.append(
+                    NON_RESETTABLE_FORMAT.format(
+                        counter.value, counter.units, counter.direction
+                    )
                 )
 
             for counter in device.counters.resettable:
-                print(
-                    f"Resettable counter Value: {counter.value}{counter.units}, Direction: {counter.direction}"
+                lines.append(
+                    RESETTABLE_FORMAT.format(
+                        counter.value, counter.units, counter.direction
+                    )
                 )
 
+        if lines:
+            print("\n".join(lines))
+
 
 asyncio.run(main())
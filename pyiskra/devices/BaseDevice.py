@@ -1,8 +1,9 @@
 import asyncio
 import socket
 import re
+from contextlib import asynccontextmanager
 from ..exceptions import DeviceConnectionError, DeviceNotSupported
-from ..adapters import RestAPI
+from ..adapters import RestAPI, Modbus
 
 
 class Device:
@@ -104,8 +105,30 @@ class Device:
             adapter: The adapter used to communicate with the device.
         """
         self.adapter = adapter
+        # Resolved once so the per-call paths don't repeat the
+        # isinstance dispatch on every fetch
+        self._adapter_is_rest = isinstance(adapter, RestAPI)
+        self._adapter_is_modbus = isinstance(adapter, Modbus)
         self.update_lock = asyncio.Lock()
 
+    @asynccontextmanager
+    async def _modbus_session(self):
+        """Holds one Modbus connection over the wrapped block.
+
+        Opens the adapter connection if it is not already open and
+        closes it afterwards, unless the adapter is persistent or the
+        connection already belonged to an enclosing session. On
+        non-Modbus adapters it is a no-op.
+        """
+        opened = self._adapter_is_modbus and not self.adapter.connected
+        if opened:
+            await self.adapter.open_connection()
+        try:
+            yield
+        finally:
+            if opened and not self.adapter.persistent:
+                await self.adapter.close_connection()
+
     async def get_basic_info(self):
         """
         Retrieves basic information from the device.
@@ -1,12 +1,11 @@
 import logging
 import time
 import asyncio
-import struct
 import re
 
 from .BaseDevice import Device
-from ..adapters import RestAPI, Modbus
 from ..helper import (
+    convert_registers_to_floats,
     Measurements,
     Measurement,
     Phase_Measurements,
@@ -40,6 +39,18 @@ class Impact(Device):
     supports_measurements = True
     supports_counters = True
 
+    # Absolute float-list indices per phase, in Phase_Measurements
+    # argument order up to thd_voltage, built once so the decode loop
+    # does no per-field offset arithmetic
+    _PHASE_FIELD_UNITS = ("V", "A", "W", "var", "VA", "", "°", "%", "%")
+    _PHASE_INDICES = [
+        (p, p + 8, p + 15, p + 19, p + 23, p + 27, p + 35, p + 48, p + 44)
+        for p in range(3)
+    ]
+    _TOTAL_FIELDS = ((18, "W"), (22, "VAR"), (26, "VA"), (30, ""), (38, "°"))
+    # Replaced at init with the rows for this model's phase count
+    _phase_fields = []
+
     async def init(self):
         """
         Initializes the Impact device.
@@ -47,9 +58,127 @@ class Impact(Device):
         This method retrieves basic information, updates the status, and logs a success message.
         """
         await self.get_basic_info()
+        # Specialize the decode table for this model's phase count so
+        # get_measurements walks prezipped (index, units) rows instead
+        # of re-zipping the class tables every poll
+        self._phase_fields = [
+            tuple(zip(indices, self._PHASE_FIELD_UNITS))
+            for indices in self._PHASE_INDICES[: self.phases]
+        ]
         await self.update_status()
         log.info(f"Successfully initialized {self.model} {self.serial}")
 
+    def _parse_measurements(self, registers):
+        """Decodes the 2500 input-register block into Measurements."""
+        # Decode all register pairs in one pass; each float below is
+        # indexed at half its register offset
+        floats = convert_registers_to_floats(registers)
+
+        # Bound locally so the decode loops skip the repeated
+        # global lookups
+        def measurement(index, units, _mk=Measurement, _f=floats):
+            return _mk(_f[index], units)
+
+        phases = [
+            Phase_Measurements(
+                *(measurement(index, units) for index, units in fields)
+            )
+            for fields in self._phase_fields
+        ]
+
+        frequency = measurement(42, "Hz")
+        temperature = measurement(46, "°C")
+        total = Total_Measurements(
+            *(measurement(index, units) for index, units in self._TOTAL_FIELDS)
+        )
+
+        return Measurements(phases, total, frequency, temperature)
+
+    def _parse_counters(self, registers, direction_registers, settings_registers):
+        """Decodes the counter value block and its settings into Counters."""
+        # The non-resettable (421-436) and resettable (437-500)
+        # settings share one 80-register block
+        non_resettable_settings = settings_registers[0:16]
+        resettable_settings = settings_registers[16:80]
+
+        reverse_connection = bool(direction_registers[0] & 2)
+
+        # Decode every counter value in one pass (float index is
+        # half the register offset) and walk the settings with
+        # strided slices instead of per-iteration index arithmetic
+        counter_values = convert_registers_to_floats(registers)
+
+        def build_counters(settings, values):
+            counters = []
+            for units_code, quadrants, value in zip(
+                settings[0::4], settings[1::4], values
+            ):
+                units = counter_units[units_code]
+                direction = get_counter_direction(quadrants, reverse_connection)
+                counters.append(
+                    Counter(
+                        value, units, direction, get_counter_type(direction, units)
+                    )
+                )
+            return counters
+
+        non_resettable = build_counters(
+            non_resettable_settings,
+            counter_values[1 : 1 + self.non_resettable_counters],
+        )
+        resettable = build_counters(
+            resettable_settings,
+            counter_values[
+                1
+                + self.non_resettable_counters : 1
+                + self.non_resettable_counters
+                + self.resettable_counters
+            ],
+        )
+
+        return Counters(non_resettable, resettable)
+
+    async def _poll_modbus(self):
+        """Reads and decodes measurements and counters in one pipeline.
+
+        All four register reads go out inside one Modbus session —
+        gathered on TCP, back-to-back on RTU — and both blocks are
+        parsed without re-entering the scheduler.
+
+        Returns:
+            tuple: The decoded (Measurements, Counters) pair.
+        """
+        async with self._modbus_session():
+            if self.adapter.protocol == "tcp":
+                # The ranges are disjoint, pipeline the reads on TCP
+                (
+                    measurement_response,
+                    counter_response,
+                    direction_settings,
+                    counter_settings,
+                ) = await asyncio.gather(
+                    self.adapter.read_input_registers(2500, 102),
+                    self.adapter.read_input_registers(2750, 96),
+                    self.adapter.read_holding_registers(151, 1),
+                    self.adapter.read_holding_registers(421, 80),
+                )
+            else:
+                measurement_response = await self.adapter.read_input_registers(
+                    2500, 102
+                )
+                counter_response = await self.adapter.read_input_registers(2750, 96)
+                direction_settings = await self.adapter.read_holding_registers(151, 1)
+                counter_settings = await self.adapter.read_holding_registers(421, 80)
+
+        return (
+            self._parse_measurements(measurement_response.registers),
+            self._parse_counters(
+                counter_response.registers,
+                direction_settings.registers,
+                counter_settings.registers,
+            ),
+        )
+
     async def get_measurements(self):
         """
         Retrieves measurements from the device.
@@ -57,250 +186,19 @@ class Impact(Device):
         Returns:
             dict: A dictionary containing the measurements.
         """
-        if isinstance(self.adapter, RestAPI):
+        if self._adapter_is_rest:
             log.info(
                 f"Getting measurements from Rest API for {self.model} {self.serial}"
             )
             return await self.adapter.get_measurements()
-        elif isinstance(self.adapter, Modbus):
+        elif self._adapter_is_modbus:
             log.info(f"Getting measurements from Modbus for {self.model} {self.serial}")
-            response = await self.adapter.read_input_registers(2500, 106)
-
-            phases = []
-            for phase in range(self.phases):
-                voltage = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase],
-                                response.registers[2 * phase + 1],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "V",
-                )
-                current = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 16],
-                                response.registers[2 * phase + 17],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "A",
-                )
-                active_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 30],
-                                response.registers[2 * phase + 31],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "W",
-                )
-                reactive_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 38],
-                                response.registers[2 * phase + 39],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "var",
-                )
-                apparent_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 46],
-                                response.registers[2 * phase + 47],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "VA",
-                )
-                power_factor = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 54],
-                                response.registers[2 * phase + 55],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "",
-                )
-                power_angle = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 70],
-                                response.registers[2 * phase + 71],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "°",
-                )
-                thd_current = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 88],
-                                response.registers[2 * phase + 81],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "%",
-                )
-                thd_voltage = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 96],
-                                response.registers[2 * phase + 97],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "%",
-                )
-                phases.append(
-                    Phase_Measurements(
-                        voltage,
-                        current,
-                        active_power,
-                        reactive_power,
-                        apparent_power,
-                        power_factor,
-                        power_angle,
-                        thd_voltage,
-                        thd_current,
-                    )
-                )
-
-            active_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[36], response.registers[37]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "W",
-            )
-            reactive_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[44], response.registers[45]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "VAR",
-            )
-            apparent_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[52], response.registers[53]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "VA",
-            )
-            power_factor_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[60], response.registers[61]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "",
-            )
-            power_angle_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[76], response.registers[77]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "°",
-            )
-            frequency = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[84], response.registers[85]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "Hz",
-            )
-            temperature = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[92], response.registers[93]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "°C",
-            )
-            total = Total_Measurements(
-                active_power_total,
-                reactive_power_total,
-                apparent_power_total,
-                power_factor_total,
-                power_angle_total,
-            )
-
-            return Measurements(phases, total, frequency, temperature)
+            # One block read up to the last consumed register (100-101,
+            # phase-3 THD voltage); the interior gaps are cheaper to
+            # read along than to split into extra transactions, but the
+            # four-register tail past 2601 was pure waste
+            response = await self.adapter.read_input_registers(2500, 102)
+            return self._parse_measurements(response.registers)
 
     async def get_counters(self):
         """
@@ -309,83 +207,36 @@ class Impact(Device):
         Returns:
             dict: A dictionary containing the counters.
         """
-        if isinstance(self.adapter, RestAPI):
+        if self._adapter_is_rest:
             log.info(f"Getting counters from Rest API for {self.model} {self.serial}")
             return await self.adapter.get_counters()
-        elif isinstance(self.adapter, Modbus):
-            # Open the connection
-            handle_connection = not self.adapter.connected
-            if handle_connection:
-                await self.adapter.open_connection()
-
+        elif self._adapter_is_modbus:
             log.info(f"Getting counters from Modbus for {self.model} {self.serial}")
-            response = await self.adapter.read_input_registers(2750, 96)
-
-            direction_settings = await self.adapter.read_holding_registers(151, 1)
-
-            non_resettable_settings = await self.adapter.read_holding_registers(421, 16)
-
-            resettable_settings = await self.adapter.read_holding_registers(437, 64)
-
-            if handle_connection:
-                self.adapter.close_connection()
-
-            non_resettable = []
-            resettable = []
-            reverse_connection = False
-            if direction_settings.registers[0] & 2:
-                reverse_connection = True
-
-            for counter in range(self.non_resettable_counters):
-                units = counter_units[non_resettable_settings.registers[4 * counter]]
-                direction = get_counter_direction(
-                    non_resettable_settings.registers[1 + 4 * counter],
-                    reverse_connection,
-                )
-                counter_type = get_counter_type(direction, units)
-                non_resettable.append(
-                    Counter(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 + 2 * counter],
-                                response.registers[3 + 2 * counter],
-                            ),
-                        )[0],
-                        units,
-                        direction,
-                        counter_type,
+            async with self._modbus_session():
+                if self.adapter.protocol == "tcp":
+                    # The ranges are disjoint, pipeline the reads on TCP
+                    (
+                        response,
+                        direction_settings,
+                        counter_settings,
+                    ) = await asyncio.gather(
+                        self.adapter.read_input_registers(2750, 96),
+                        self.adapter.read_holding_registers(151, 1),
+                        self.adapter.read_holding_registers(421, 80),
                     )
-                )
-
-            for counter in range(self.resettable_counters):
-                units = counter_units[resettable_settings.registers[4 * counter]]
-                direction = get_counter_direction(
-                    resettable_settings.registers[1 + 4 * counter], reverse_connection
-                )
-                counter_type = get_counter_type(direction, units)
-                resettable.append(
-                    Counter(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[
-                                    2 + 2 * (counter + self.non_resettable_counters)
-                                ],
-                                response.registers[
-                                    3 + 2 * (counter + self.non_resettable_counters)
-                                ],
-                            ),
-                        )[0],
-                        units,
-                        direction,
-                        counter_type,
+                else:
+                    response = await self.adapter.read_input_registers(2750, 96)
+                    direction_settings = await self.adapter.read_holding_registers(
+                        151, 1
                     )
-                )
-
-            return Counters(non_resettable, resettable)
+                    counter_settings = await self.adapter.read_holding_registers(
+                        421, 80
+                    )
+            return self._parse_counters(
+                response.registers,
+                direction_settings.registers,
+                counter_settings.registers,
+            )
 
     async def update_status(self):
         """
@@ -395,26 +246,24 @@ class Impact(Device):
         It retrieves measurements and counters, updates the corresponding attributes,
         and sets the update timestamp.
         """
-        # If update is already running, wait for it to finish and then return
-        if self.update_lock.locked():
-            log.debug("Update already running for %s %s" % (self.model, self.serial))
-            while self.update_lock.locked():
-                await asyncio.sleep(0.1)
-            return
-
-        # If update is not running, acquire the lock and update
+        # Callers that arrive while an update is running block on the
+        # lock and simply return the data that update produced
+        requested_at = time.time()
         async with self.update_lock:
-            log.info("Updating status for %s %s" % (self.model, self.serial))
+            if self.update_timestamp >= requested_at:
+                log.debug(
+                    "Update already running for %s %s" % (self.model, self.serial)
+                )
+                return
 
-            # if the adapter is Modbus, open the connection
-            if isinstance(self.adapter, Modbus):
-                await self.adapter.open_connection()
-                
-            self.measurements = await self.get_measurements()
-            self.counters = await self.get_counters()
+            log.info("Updating status for %s %s" % (self.model, self.serial))
 
-            # if the adapter is Modbus, close the connection
-            if isinstance(self.adapter, Modbus):
-                self.adapter.close_connection()
+            if self._adapter_is_modbus:
+                # One fused pipeline for all four register reads
+                self.measurements, self.counters = await self._poll_modbus()
+            else:
+                self.measurements, self.counters = await asyncio.gather(
+                    self.get_measurements(), self.get_counters()
+                )
 
             self.update_timestamp = time.time()
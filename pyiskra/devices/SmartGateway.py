@@ -3,6 +3,7 @@ from ..adapters.RestAPI import RestAPI
 from ..exceptions import DeviceNotSupported, DeviceConnectionError
 
 
+import asyncio
 import logging
 
 log = logging.getLogger(__name__)
@@ -55,28 +56,40 @@ class SmartGateway(Device):
         child_devices = [
             device for device in child_devices if "Right IR" not in device["interface"]
         ]
-        for i, device in enumerate(child_devices):
-            if device["model"] != "Disabled" and device["model"] != "Not Detected":
-                log.info(
-                    f"Found device {device['model']} {device['serial']} connected to {self.model} {self.serial}"
+
+        async def create_child_device(i, device):
+            log.info(
+                f"Found device {device['model']} {device['serial']} connected to {self.model} {self.serial}"
+            )
+            adapter = RestAPI(
+                ip_address=self.adapter.ip_address,
+                authentication=self.adapter.authentication,
+                device_index=i,
+            )
+            try:
+                dev = await Device.create_device(adapter)
+                await dev.init()
+                return dev
+            except DeviceNotSupported as e:
+                log.error(
+                    f"Failed to create device {device['model']} {device['serial']}: {e}"
                 )
-                adapter = RestAPI(
-                    ip_address=self.adapter.ip_address,
-                    authentication=self.adapter.authentication,
-                    device_index=i,
+            except DeviceConnectionError as e:
+                log.error(
+                    f"Failed to connect to device {device['model']} {device['serial']}: {e}"
                 )
-                try:
-                    dev = await Device.create_device(adapter)
-                    await dev.init()
-                    self.child_devices.append(dev)
-                except DeviceNotSupported as e:
-                    log.error(
-                        f"Failed to create device {device['model']} {device['serial']}: {e}"
-                    )
-                except DeviceConnectionError as e:
-                    log.error(
-                        f"Failed to connect to device {device['model']} {device['serial']}: {e}"
-                    )
+            return None
+
+        # Initialize all child devices concurrently, each one is a
+        # separate REST API target so the requests don't contend
+        children = await asyncio.gather(
+            *[
+                create_child_device(i, device)
+                for i, device in enumerate(child_devices)
+                if device["model"] != "Disabled" and device["model"] != "Not Detected"
+            ]
+        )
+        self.child_devices = [child for child in children if child is not None]
 
     def get_child_devices(self):
         """
@@ -1,12 +1,11 @@
 import logging
 import time
 import asyncio
-import struct
 
 from pyiskra.exceptions import InvalidResponseCode
 from .BaseDevice import Device
-from ..adapters import RestAPI, Modbus
 from ..helper import (
+    convert_registers_to_floats,
     Measurements,
     Measurement,
     Phase_Measurements,
@@ -41,6 +40,15 @@ class WM(Device):
     supports_measurements = True
     supports_counters = True
 
+    # Absolute float-list indices per phase, in Phase_Measurements
+    # argument order up to thd_voltage, built once so the decode loop
+    # does no per-field offset arithmetic
+    _PHASE_FIELD_UNITS = ("V", "A", "W", "var", "VA", "", "°", "%", "%")
+    _PHASE_INDICES = [
+        (p, p + 8, p + 15, p + 19, p + 23, p + 27, p + 35, p + 48, p + 44)
+        for p in range(3)
+    ]
+
     async def init(self):
         """
         Initializes the Impact device.
@@ -58,247 +66,46 @@ class WM(Device):
         Returns:
             dict: A dictionary containing the measurements.
         """
-        if isinstance(self.adapter, RestAPI):
+        if self._adapter_is_rest:
             log.info(
                 f"Getting measurements from Rest API for {self.model} {self.serial}"
             )
             return await self.adapter.get_measurements()
-        elif isinstance(self.adapter, Modbus):
+        elif self._adapter_is_modbus:
             log.info(f"Getting measurements from Modbus for {self.model} {self.serial}")
             response = await self.adapter.read_input_registers(2500, 106)
 
+            # Decode all register pairs in one pass; each float below is
+            # indexed at half its register offset
+            regs = response.registers
+            floats = convert_registers_to_floats(regs)
+
+            # Bound locally so the decode loops skip the repeated
+            # global and builtin lookups
+            def measurement(index, units, _mk=Measurement, _f=floats):
+                return _mk(_f[index], units)
+
             phases = []
             for phase in range(self.phases):
-                voltage = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase],
-                                response.registers[2 * phase + 1],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "V",
-                )
-                current = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 16],
-                                response.registers[2 * phase + 17],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "A",
-                )
-                active_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 30],
-                                response.registers[2 * phase + 31],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "W",
-                )
-                reactive_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 38],
-                                response.registers[2 * phase + 39],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "var",
-                )
-                apparent_power = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 46],
-                                response.registers[2 * phase + 47],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "VA",
-                )
-                power_factor = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 54],
-                                response.registers[2 * phase + 55],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "",
-                )
-                power_angle = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 70],
-                                response.registers[2 * phase + 71],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "°",
-                )
-                thd_current = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 88],
-                                response.registers[2 * phase + 81],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "%",
-                )
-                thd_voltage = Measurement(
-                    round(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * phase + 96],
-                                response.registers[2 * phase + 97],
-                            ),
-                        )[0],
-                        3,
-                    ),
-                    "%",
-                )
                 phases.append(
                     Phase_Measurements(
-                        voltage,
-                        current,
-                        active_power,
-                        reactive_power,
-                        apparent_power,
-                        power_factor,
-                        power_angle,
-                        thd_voltage,
-                        thd_current,
+                        *(
+                            measurement(index, units)
+                            for index, units in zip(
+                                self._PHASE_INDICES[phase], self._PHASE_FIELD_UNITS
+                            )
+                        )
                     )
                 )
 
-            active_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[36], response.registers[37]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "W",
-            )
-            reactive_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[44], response.registers[45]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "VAR",
-            )
-            apparent_power_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[52], response.registers[53]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "VA",
-            )
-            power_factor_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[60], response.registers[61]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "",
-            )
-            power_angle_total = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[76], response.registers[77]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "°",
-            )
-            frequency = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[84], response.registers[85]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "Hz",
-            )
-            temperature = Measurement(
-                round(
-                    struct.unpack(
-                        ">f",
-                        struct.pack(
-                            ">HH", response.registers[92], response.registers[93]
-                        ),
-                    )[0],
-                    3,
-                ),
-                "°C",
-            )
+            frequency = measurement(42, "Hz")
+            temperature = measurement(46, "°C")
             total = Total_Measurements(
-                active_power_total,
-                reactive_power_total,
-                apparent_power_total,
-                power_factor_total,
-                power_angle_total,
+                measurement(18, "W"),
+                measurement(22, "VAR"),
+                measurement(26, "VA"),
+                measurement(30, ""),
+                measurement(38, "°"),
             )
 
             return Measurements(phases, total, frequency, temperature)
@@ -310,24 +117,32 @@ class WM(Device):
         Returns:
             dict: A dictionary containing the counters.
         """
-        if isinstance(self.adapter, RestAPI):
+        if self._adapter_is_rest:
             log.info(f"Getting counters from Rest API for {self.model} {self.serial}")
             return await self.adapter.get_counters()
-        elif isinstance(self.adapter, Modbus):
+        elif self._adapter_is_modbus:
             log.info(f"Getting measurements from Modbus for {self.model} {self.serial}")
 
-            # Open the connection
-            handle_connection = not self.adapter.connected
-            if handle_connection:
-                await self.adapter.open_connection()
-
-            response = await self.adapter.read_input_registers(2638, 16)
-            direction_settings = await self.adapter.read_holding_registers(151, 1)
-            resettable_settings = await self.adapter.read_holding_registers(421, 36)
-
-            # Close the connection
-            if handle_connection:
-                self.adapter.close_connection()
+            async with self._modbus_session():
+                if self.adapter.protocol == "tcp":
+                    # The ranges are disjoint, pipeline the reads on TCP
+                    (
+                        response,
+                        direction_settings,
+                        resettable_settings,
+                    ) = await asyncio.gather(
+                        self.adapter.read_input_registers(2638, 16),
+                        self.adapter.read_holding_registers(151, 1),
+                        self.adapter.read_holding_registers(421, 36),
+                    )
+                else:
+                    response = await self.adapter.read_input_registers(2638, 16)
+                    direction_settings = await self.adapter.read_holding_registers(
+                        151, 1
+                    )
+                    resettable_settings = await self.adapter.read_holding_registers(
+                        421, 36
+                    )
 
             non_resettable = []
             resettable = []
@@ -335,25 +150,21 @@ class WM(Device):
             if direction_settings.registers[0] & 2:
                 reverse_connection = True
 
+            counter_values = convert_registers_to_floats(response.registers)
+            # Bind the loop's globals and attribute chains to locals
+            settings = resettable_settings.registers
+            append = resettable.append
             for counter in range(self.resettable_counters):
-                units = counter_units[resettable_settings.registers[10 * counter]]
+                units = counter_units[settings[10 * counter]]
                 direction = get_counter_direction(
-                    resettable_settings.registers[1 + 10 * counter], reverse_connection
+                    settings[1 + 10 * counter], reverse_connection
                 )
-                counter_type = get_counter_type(direction, units)
-                resettable.append(
+                append(
                     Counter(
-                        struct.unpack(
-                            ">f",
-                            struct.pack(
-                                ">HH",
-                                response.registers[2 * (counter)],
-                                response.registers[1 + 2 * (counter)],
-                            ),
-                        )[0],
+                        counter_values[counter],
                         units,
                         direction,
-                        counter_type,
+                        get_counter_type(direction, units),
                     )
                 )
 
@@ -367,26 +178,29 @@ class WM(Device):
         It retrieves measurements and counters, updates the corresponding attributes,
         and sets the update timestamp.
         """
-        # If update is already running, wait for it to finish and then return
-        if self.update_lock.locked():
-            log.debug("Update already running for %s %s" % (self.model, self.serial))
-            while self.update_lock.locked():
-                await asyncio.sleep(0.1)
-            return
-
-        # If update is not running, acquire the lock and update
+        # Callers that arrive while an update is running block on the
+        # lock and simply return the data that update produced
+        requested_at = time.time()
         async with self.update_lock:
-            log.info("Updating status for %s %s" % (self.model, self.serial))
-
-            # if the adapter is Modbus, open the connection
-            if isinstance(self.adapter, Modbus):
-                await self.adapter.open_connection()
+            if self.update_timestamp >= requested_at:
+                log.debug(
+                    "Update already running for %s %s" % (self.model, self.serial)
+                )
+                return
 
-            self.measurements = await self.get_measurements()
-            self.counters = await self.get_counters()
+            log.info("Updating status for %s %s" % (self.model, self.serial))
 
-            # if the adapter is Modbus, close the connection
-            if isinstance(self.adapter, Modbus):
-                self.adapter.close_connection()
+            # Hold one Modbus connection for the whole update
+            async with self._modbus_session():
+                # Pipeline the two fetches where the transport allows
+                # concurrent transactions; RTU is half-duplex, so its
+                # reads stay sequential
+                if not self._adapter_is_modbus or self.adapter.protocol == "tcp":
+                    self.measurements, self.counters = await asyncio.gather(
+                        self.get_measurements(), self.get_counters()
+                    )
+                else:
+                    self.measurements = await self.get_measurements()
+                    self.counters = await self.get_counters()
 
             self.update_timestamp = time.time()
@@ -1,8 +1,7 @@
 import asyncio
 import socket
-import netifaces
+import psutil
 import logging
-import socket
 
 log = logging.getLogger(__name__)
 
@@ -80,19 +79,21 @@ class Discovery:
             if ip:
                 broadcast_ips = [ip]
             else:
+                # Get the broadcast addresses for each network interface,
+                # skipping down, loopback and duplicate addresses up front
                 broadcast_ips = []
-                # Get all network interfaces
-                interfaces = netifaces.interfaces()
-
-                # Get the broadcast addresses for each interface
-                broadcast_ips = []
-                for interface in interfaces:
-                    addresses = netifaces.ifaddresses(interface)
-                    if netifaces.AF_INET in addresses:
-                        ipv4_addresses = addresses[netifaces.AF_INET]
-                        for address in ipv4_addresses:
-                            if "broadcast" in address:
-                                broadcast_ips.append(address["broadcast"])
+                stats = psutil.net_if_stats()
+                for interface, addresses in psutil.net_if_addrs().items():
+                    if interface not in stats or not stats[interface].isup:
+                        continue
+                    for address in addresses:
+                        if address.family != socket.AF_INET:
+                            continue
+                        if (address.address or "").startswith("127."):
+                            continue
+                        broadcast = address.broadcast
+                        if broadcast and broadcast not in broadcast_ips:
+                            broadcast_ips.append(broadcast)
 
             # Broadcast UDP packets to all IPs concurrently
             await asyncio.gather(
@@ -1,8 +1,11 @@
+import struct
 import time
 from enum import Enum
 
 
 class BasicInfo:
+    __slots__ = ("serial", "model", "description", "location", "sw_ver")
+
     def __init__(
         self,
         serial,
@@ -19,6 +22,8 @@ class BasicInfo:
 
 
 class Measurement:
+    __slots__ = ("value", "units")
+
     value: float
     units: str
 
@@ -28,6 +33,18 @@ class Measurement:
 
 
 class Phase_Measurements:
+    __slots__ = (
+        "voltage",
+        "current",
+        "active_power",
+        "reactive_power",
+        "apparent_power",
+        "power_factor",
+        "power_angle",
+        "thd_voltage",
+        "thd_current",
+    )
+
     voltage: Measurement
     current: Measurement
     active_power: Measurement
@@ -62,6 +79,14 @@ class Phase_Measurements:
 
 
 class Total_Measurements:
+    __slots__ = (
+        "active_power",
+        "reactive_power",
+        "apparent_power",
+        "power_factor",
+        "power_angle",
+    )
+
     active_power: Measurement
     reactive_power: Measurement
     apparent_power: Measurement
@@ -84,6 +109,8 @@ class Total_Measurements:
 
 
 class Measurements:
+    __slots__ = ("timestamp", "phases", "total", "frequency", "temperature")
+
     phases: list[Phase_Measurements]
     total: Total_Measurements
     frequency: Measurement
@@ -109,6 +136,8 @@ class CounterType(Enum):
 
 
 class Counter:
+    __slots__ = ("value", "units", "direction", "counter_type")
+
     value: float
     units: str
     direction: str
@@ -128,6 +157,8 @@ class Counter:
 
 
 class Counters:
+    __slots__ = ("timestamp", "non_resettable", "resettable")
+
     non_resettable: list[Counter]
     resettable: list[Counter]
 
@@ -139,6 +170,31 @@ class Counters:
 
 counter_units = ["", "Wh", "varh", "VAh"]
 
+# Compiled once so repeated decodes skip the format-string parse
+_FLOAT32 = struct.Struct(">f")
+_WORD_PACKERS = {}
+
+
+def _words_struct(count):
+    """Returns a compiled Struct packing `count` big-endian registers."""
+    try:
+        return _WORD_PACKERS[count]
+    except KeyError:
+        packer = _WORD_PACKERS[count] = struct.Struct(f">{count}H")
+        return packer
+
+
+def convert_registers_to_floats(registers):
+    """Decodes consecutive big-endian register pairs into a list of floats.
+
+    Each float32 value spans two 16-bit registers. The whole block is
+    packed and unpacked in a single C call each, so callers can index
+    the result at half the register offset instead of reassembling one
+    register pair at a time.
+    """
+    raw = _words_struct(len(registers)).pack(*registers)
+    return [value for (value,) in _FLOAT32.iter_unpack(raw)]
+
 
 def get_counter_direction(quadrants, reverse_connection):
     quadrants = quadrants & 0x0F
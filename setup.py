@@ -26,5 +26,5 @@ setup(
         "Topic :: Software Development :: Libraries :: Application Frameworks",
         "Topic :: Home Automation",
     ],
-    install_requires=["netifaces", "aiohttp", "pymodbus"],
+    install_requires=["psutil", "aiohttp", "pymodbus"],
 )